@@ -1,26 +1,63 @@
-from flask import Flask, jsonify
+from flask import Flask, Response, current_app
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
+from functools import cache
+import orjson
 import os
 
-def create_app() -> Flask:
-    """Application factory pattern for Benkyo-Fi."""
-    
-    app = Flask(__name__)
+from .json_provider import ORJSONProvider
 
-    # Configure CORS for frontend integration
-    allowed_origins = [
+@cache
+def _allowed_origins() -> tuple:
+    """Resolve CORS origins once per process, including ALLOWED_ORIGINS extras."""
+    origins = (
         'http://localhost:3000',  # Development
         'http://192.168.0.23:3000',  # Development
         'https://benky-fy-frontend-193852054448.asia-northeast1.run.app',  # Production
         'https://benkyfy.site' # Production
-    ]
+    )
     
     # Allow additional origins from environment variable
-    if os.environ.get('ALLOWED_ORIGINS'):
-        additional_origins = os.environ.get('ALLOWED_ORIGINS').split(',')
-        allowed_origins.extend(additional_origins)
+    additional_origins = os.environ.get('ALLOWED_ORIGINS')
+    if additional_origins:
+        return (*origins, *additional_origins.split(','))
+    return origins
+
+# Static /health payload, encoded once for frequent liveness probes
+_HEALTH_BODY = b'{"service":"benky-fy-backend","status":"healthy"}\n'
+
+# JSON error messages for the HTTP errors handled explicitly
+_ERROR_MESSAGES = {
+    400: 'Bad request',
+    404: 'Endpoint not found',
+    500: 'Internal server error',
+}
+
+# Error payloads are static, so encode them once instead of per error
+_ERROR_BODIES = {
+    code: orjson.dumps({'error': message, 'status': code}, option=orjson.OPT_APPEND_NEWLINE)
+    for code, message in _ERROR_MESSAGES.items()
+}
+_UNEXPECTED_ERROR_BODY = orjson.dumps(
+    {'error': 'An unexpected error occurred', 'status': 500}, option=orjson.OPT_APPEND_NEWLINE)
+
+def _handle_error(error):
+    """Render handled HTTP errors and any other exception as a JSON error."""
+    code = error.code if isinstance(error, HTTPException) else None
+    if code not in _ERROR_BODIES:
+        if code is None:
+            current_app.logger.error("Unhandled exception", exc_info=error)
+        return Response(_UNEXPECTED_ERROR_BODY, status=500, mimetype='application/json')
+    return Response(_ERROR_BODIES[code], status=code, mimetype='application/json')
+
+def create_app() -> Flask:
+    """Application factory pattern for Benkyo-Fi."""
     
-    CORS(app, origins=allowed_origins, supports_credentials=True)
+    app = Flask(__name__)
+    app.json = ORJSONProvider(app)
+
+    # Configure CORS for frontend integration (preflights cached for 24h)
+    CORS(app, origins=list(_allowed_origins()), supports_credentials=True, max_age=86400)
 
     # Configure app
     app.secret_key = os.environ.get("FLASK_SECRET_KEY", "superkey-benky-fy")
@@ -28,24 +65,12 @@ def create_app() -> Flask:
     # Health check endpoint
     @app.route('/health')
     def health_check():
-        return jsonify({'status': 'healthy', 'service': 'benky-fy-backend'}), 200
+        return Response(_HEALTH_BODY, status=200, mimetype='application/json')
 
     # Global error handlers
-    @app.errorhandler(404)
-    def not_found(error):
-        return jsonify({'error': 'Endpoint not found', 'status': 404}), 404
-    
-    @app.errorhandler(400)
-    def bad_request(error):
-        return jsonify({'error': 'Bad request', 'status': 400}), 400
-    
-    @app.errorhandler(500)
-    def internal_error(error):
-        return jsonify({'error': 'Internal server error', 'status': 500}), 500
-    
-    @app.errorhandler(Exception)
-    def handle_exception(e):
-        return jsonify({'error': 'An unexpected error occurred', 'status': 500}), 500
+    for code in _ERROR_MESSAGES:
+        app.register_error_handler(code, _handle_error)
+    app.register_error_handler(Exception, _handle_error)
 
     # Initialize V2 application
     from .v2 import init_v2_app
@@ -1,6 +1,5 @@
 from flask_restx import Api, Resource, fields
 from flask import Blueprint, session
-import json
 
 # Create API blueprint
 bp = Blueprint('v2_auth_api', __name__)
@@ -0,0 +1,87 @@
+import hashlib
+import json
+import logging
+import orjson
+import os
+import threading
+import uuid
+from functools import lru_cache
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# Word modules served by the V2 API, in search order
+MODULES = ('verbs', 'adjectives', 'hiragana', 'katakana', 'numbers_basic',
+           'numbers_extended', 'days_of_week', 'months_complete',
+           'colors_basic', 'greetings_essential', 'question_words',
+           'base_nouns', 'katakana_words')
+
+def _module_path(module_name: str) -> str:
+    """Return the dataset path for a module (relative to project root)."""
+    return f"./datum/{module_name}.json"
+
+def generate_word_id(word: dict) -> str:
+    """Generate the deterministic ID the V2 API uses for a word."""
+    word_content = f"{word.get('kanji', '')}{word.get('hiragana', '')}{word.get('english', '')}"
+    word_hash = hashlib.md5(word_content.encode()).hexdigest()
+    return str(uuid.uuid5(uuid.NAMESPACE_DNS, word_hash))
+
+@lru_cache(maxsize=None)
+def _load_json(path: str, mtime: float) -> Any:
+    """Parse a dataset once per (path, mtime); edits on disk bust the cache."""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+def load_json_file(file_path: str) -> Any:
+    """Parse a JSON file through the shared (path, mtime) cache.
+
+    Raises OSError or json.JSONDecodeError like a plain read would. The
+    returned object is shared between callers and must not be mutated.
+    """
+    return _load_json(os.path.abspath(file_path), os.path.getmtime(file_path))
+
+def load_module_data(module_name: str) -> list:
+    """Load word data for a module from the shared dataset cache.
+
+    The returned list is shared between requests and must not be mutated.
+    """
+    file_path = _module_path(module_name)
+
+    try:
+        mtime = os.path.getmtime(file_path)
+    except OSError:
+        return []
+
+    try:
+        return _load_json(os.path.abspath(file_path), mtime)
+    except (json.JSONDecodeError, IOError) as e:  # orjson errors subclass JSONDecodeError
+        logger.warning("Error loading %s.json: %s", module_name, e)
+        return []
+
+# (module, kind) -> (dataset list it was built from, derived value)
+_derived_cache = {}
+
+def derive_module_data(module_name: str, kind: str, build: Callable[[list], Any]) -> Any:
+    """Return build(words) for a module, cached until its dataset is reloaded.
+
+    Use for per-module lookup tables that would otherwise be recomputed on
+    every request. Like the dataset itself, the result must not be mutated.
+    """
+    words = load_module_data(module_name)
+    if not words:
+        return build(words)
+
+    key = (module_name, kind)
+    cached = _derived_cache.get(key)
+    if cached is None or cached[0] is not words:
+        cached = (words, build(words))
+        _derived_cache[key] = cached
+    return cached[1]
+
+def _prewarm():
+    for module in MODULES:
+        load_module_data(module)
+
+def prewarm_module_data():
+    """Populate the dataset cache in the background so first requests find it hot."""
+    threading.Thread(target=_prewarm, name='v2-data-prewarm', daemon=True).start()
@@ -1,5 +1,6 @@
-from flask import Response, json
+from flask import Response, json, current_app, make_response
 import gzip
+import orjson
 from functools import wraps
 
 def compress_json(f):
@@ -24,3 +25,13 @@ def compress_json(f):
             return response
         return resp
     return wrapped
+
+def output_json(data, code, headers=None):
+    """Flask-RESTX JSON representation encoded with orjson."""
+    options = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if current_app.debug:
+        options |= orjson.OPT_INDENT_2
+    
+    resp = make_response(orjson.dumps(data, option=options), code)
+    resp.headers.extend(headers or {})
+    return resp
@@ -0,0 +1,106 @@
+from functools import lru_cache
+from typing import Any, Dict
+
+# Hepburn (plus common kunrei/IME spellings) romaji -> hiragana
+ROMAJI_TO_HIRAGANA = {
+    'a': 'あ', 'i': 'い', 'u': 'う', 'e': 'え', 'o': 'お',
+    'ka': 'か', 'ki': 'き', 'ku': 'く', 'ke': 'け', 'ko': 'こ',
+    'ga': 'が', 'gi': 'ぎ', 'gu': 'ぐ', 'ge': 'げ', 'go': 'ご',
+    'sa': 'さ', 'shi': 'し', 'si': 'し', 'su': 'す', 'se': 'せ', 'so': 'そ',
+    'za': 'ざ', 'ji': 'じ', 'zi': 'じ', 'zu': 'ず', 'ze': 'ぜ', 'zo': 'ぞ',
+    'ta': 'た', 'chi': 'ち', 'ti': 'ち', 'tsu': 'つ', 'tu': 'つ', 'te': 'て', 'to': 'と',
+    'da': 'だ', 'di': 'ぢ', 'du': 'づ', 'de': 'で', 'do': 'ど',
+    'na': 'な', 'ni': 'に', 'nu': 'ぬ', 'ne': 'ね', 'no': 'の',
+    'ha': 'は', 'hi': 'ひ', 'fu': 'ふ', 'hu': 'ふ', 'he': 'へ', 'ho': 'ほ',
+    'ba': 'ば', 'bi': 'び', 'bu': 'ぶ', 'be': 'べ', 'bo': 'ぼ',
+    'pa': 'ぱ', 'pi': 'ぴ', 'pu': 'ぷ', 'pe': 'ぺ', 'po': 'ぽ',
+    'ma': 'ま', 'mi': 'み', 'mu': 'む', 'me': 'め', 'mo': 'も',
+    'ya': 'や', 'yu': 'ゆ', 'yo': 'よ',
+    'ra': 'ら', 'ri': 'り', 'ru': 'る', 're': 'れ', 'ro': 'ろ',
+    'wa': 'わ', 'wo': 'を',
+    'kya': 'きゃ', 'kyu': 'きゅ', 'kyo': 'きょ',
+    'gya': 'ぎゃ', 'gyu': 'ぎゅ', 'gyo': 'ぎょ',
+    'sha': 'しゃ', 'shu': 'しゅ', 'sho': 'しょ', 'she': 'しぇ',
+    'sya': 'しゃ', 'syu': 'しゅ', 'syo': 'しょ',
+    'ja': 'じゃ', 'ju': 'じゅ', 'jo': 'じょ', 'je': 'じぇ',
+    'jya': 'じゃ', 'jyu': 'じゅ', 'jyo': 'じょ',
+    'zya': 'じゃ', 'zyu': 'じゅ', 'zyo': 'じょ',
+    'cha': 'ちゃ', 'chu': 'ちゅ', 'cho': 'ちょ', 'che': 'ちぇ',
+    'tya': 'ちゃ', 'tyu': 'ちゅ', 'tyo': 'ちょ',
+    'nya': 'にゃ', 'nyu': 'にゅ', 'nyo': 'にょ',
+    'hya': 'ひゃ', 'hyu': 'ひゅ', 'hyo': 'ひょ',
+    'bya': 'びゃ', 'byu': 'びゅ', 'byo': 'びょ',
+    'pya': 'ぴゃ', 'pyu': 'ぴゅ', 'pyo': 'ぴょ',
+    'mya': 'みゃ', 'myu': 'みゅ', 'myo': 'みょ',
+    'rya': 'りゃ', 'ryu': 'りゅ', 'ryo': 'りょ',
+    'fa': 'ふぁ', 'fi': 'ふぃ', 'fe': 'ふぇ', 'fo': 'ふぉ',
+    'xa': 'ぁ', 'xi': 'ぃ', 'xu': 'ぅ', 'xe': 'ぇ', 'xo': 'ぉ',
+    'xya': 'ゃ', 'xyu': 'ゅ', 'xyo': 'ょ', 'xtsu': 'っ', 'xtu': 'っ',
+    "n'": 'ん', 'n': 'ん',
+    '-': 'ー',
+}
+
+# Consonants that are doubled to spell a small っ ("nn" is ん, see below)
+_GEMINATE_CONSONANTS = frozenset('bcdfghjkmpqrstvwxyz')
+
+# Letters that start an n-row syllable after "n" ("konnichiha" is ん + に)
+_N_SYLLABLE_STARTS = frozenset('aiueoy')
+
+def _build_trie(table: Dict[str, str]) -> Dict[str, Any]:
+    """Build a nested-dict trie over the romaji keys.
+
+    Each node maps the next character to its child node; a node that
+    completes a romaji spelling stores the kana under the '' key.
+    """
+    trie = {}
+    for romaji, kana in table.items():
+        node = trie
+        for char in romaji:
+            node = node.setdefault(char, {})
+        node[''] = kana
+    return trie
+
+# Walked one character at a time, so each position finds its longest
+# spelling without slicing candidate substrings
+_TRIE = _build_trie(ROMAJI_TO_HIRAGANA)
+
+@lru_cache(maxsize=4096)
+def convert_to_hiragana(text: str) -> str:
+    """Convert romaji in text to hiragana, leaving any other characters as is."""
+    text = text.lower()
+    result = []
+    i = 0
+    length = len(text)
+
+    while i < length:
+        char = text[i]
+        following = text[i + 1] if i + 1 < length else ''
+
+        # Doubled consonant ("kk", "tt") or "tch" spells a small っ
+        if char in _GEMINATE_CONSONANTS and (following == char or (char == 't' and following == 'c')):
+            result.append('っ')
+            i += 1
+            continue
+
+        # IME-style "nn" is a single ん unless the second n starts a syllable
+        if char == 'n' and following == 'n' and (i + 2 >= length or text[i + 2] not in _N_SYLLABLE_STARTS):
+            result.append('ん')
+            i += 2
+            continue
+
+        # Longest spelling starting at i: remember the last terminal node seen
+        node = _TRIE
+        match, match_end = char, i + 1
+        j = i
+        while j < length:
+            node = node.get(text[j])
+            if node is None:
+                break
+            j += 1
+            if '' in node:
+                match, match_end = node[''], j
+
+        result.append(match)
+        i = match_end
+
+    return ''.join(result)
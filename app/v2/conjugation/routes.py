@@ -1,11 +1,9 @@
 from flask_restx import Api, Resource, fields
-from flask import Blueprint
-import json
-import os
-import hashlib
-import uuid
+from flask import Blueprint, request
 from typing import Dict, List, Any
 
+from ..common.data_loader import MODULES, derive_module_data, generate_word_id
+
 # Create API blueprint
 bp = Blueprint('v2_conjugation_api', __name__)
 api = Api(bp, 
@@ -20,6 +18,7 @@ Generate conjugation forms for Japanese words. Pattern-based conjugation with no
 ## How to Use
 1. **Get word ID**: First call `/v2/words/{module}` to get word IDs
 2. **Conjugate**: Use word ID in `/v2/conjugation/{word_id}`
+3. **Batch**: POST `{"word_ids": [...]}` to `/v2/conjugation/batch` to conjugate several words at once
 
 ## Supported Word Types
 - **Verbs**: polite, negative, past, past_negative forms
@@ -66,96 +65,99 @@ error_model = api.model('Error', {
     'error': fields.String(description='Error message')
 })
 
-def _load_word_data(word_id: str) -> Dict[str, Any]:
-    """Load word data by ID from all modules."""
-    modules = ['verbs', 'adjectives', 'hiragana', 'katakana', 'numbers_basic', 
-               'numbers_extended', 'days_of_week', 'months_complete', 
-               'colors_basic', 'greetings_essential', 'question_words', 
-               'base_nouns', 'katakana_words']
-    
-    for module in modules:
-        file_path = f"./datum/{module}.json"
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    words = json.load(f)
-                    for word in words:
-                        # Generate deterministic ID for this word
-                        word_content = f"{word.get('kanji', '')}{word.get('hiragana', '')}{word.get('english', '')}"
-                        word_hash = hashlib.md5(word_content.encode()).hexdigest()
-                        generated_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, word_hash))
-                        if generated_id == word_id:
-                            return word
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading {module}.json: {e}")
-                continue
-    return None
+batch_request_model = api.model('ConjugationBatchRequest', {
+    'word_ids': fields.List(fields.String, required=True, description='Word identifiers from words endpoint')
+})
+
+batch_response_model = api.model('ConjugationBatchResponse', {
+    'results': fields.List(fields.Nested(conjugation_response_model), description='Conjugations for the words found'),
+    'not_found': fields.List(fields.String, description='Requested IDs that matched no word')
+})
+
+# Upper bound on word IDs accepted by the batch endpoint
+MAX_BATCH_SIZE = 100
+
+# (form, suffix) tables appended to the base form, in response order
+VERB_FORM_SUFFIXES = (
+    ("polite", "ます"),
+    ("negative", "ない"),
+    ("past", "た"),
+    ("past_negative", "なかった"),
+)
+
+ADJECTIVE_FORM_SUFFIXES = (
+    ("present", ""),
+    ("past", "だった"),
+    ("negative", "ではない"),
+)
+
+# Word type -> suffix table; types not listed only get their base form
+FORM_SUFFIXES_BY_TYPE = {
+    "verb": VERB_FORM_SUFFIXES,
+    "adjective": ADJECTIVE_FORM_SUFFIXES,
+}
+
+def _suffix_forms(word_data: Dict[str, Any], form_suffixes) -> List[Dict[str, Any]]:
+    """Append each (form, suffix) pair to the word's base kanji/hiragana."""
+    base_kanji = word_data.get('kanji', '')
+    base_hiragana = word_data.get('hiragana', '')
+    return [
+        {
+            "form": form,
+            "kanji": base_kanji + suffix if base_kanji else "",
+            "hiragana": base_hiragana + suffix if base_hiragana else ""
+        }
+        for form, suffix in form_suffixes
+    ]
 
 def _generate_conjugations(word_data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Generate conjugation forms for a word based on its type."""
-    conjugations = []
-    word_type = word_data.get('type', 'noun')
-    
-    if word_type == 'verb':
-        base_kanji = word_data.get('kanji', '')
-        base_hiragana = word_data.get('hiragana', '')
-        
-        # Basic conjugation patterns
-        conjugations = [
-            {
-                "form": "polite",
-                "kanji": base_kanji + "ます" if base_kanji else "",
-                "hiragana": base_hiragana + "ます" if base_hiragana else ""
-            },
-            {
-                "form": "negative",
-                "kanji": base_kanji + "ない" if base_kanji else "",
-                "hiragana": base_hiragana + "ない" if base_hiragana else ""
-            },
-            {
-                "form": "past",
-                "kanji": base_kanji + "た" if base_kanji else "",
-                "hiragana": base_hiragana + "た" if base_hiragana else ""
-            },
-            {
-                "form": "past_negative",
-                "kanji": base_kanji + "なかった" if base_kanji else "",
-                "hiragana": base_hiragana + "なかった" if base_hiragana else ""
-            }
-        ]
-    elif word_type == 'adjective':
-        base_kanji = word_data.get('kanji', '')
-        base_hiragana = word_data.get('hiragana', '')
-        
-        # Adjective conjugation patterns
-        conjugations = [
-            {
-                "form": "present",
-                "kanji": base_kanji,
-                "hiragana": base_hiragana
-            },
-            {
-                "form": "past",
-                "kanji": base_kanji + "だった" if base_kanji else "",
-                "hiragana": base_hiragana + "だった" if base_hiragana else ""
-            },
-            {
-                "form": "negative",
-                "kanji": base_kanji + "ではない" if base_kanji else "",
-                "hiragana": base_hiragana + "ではない" if base_hiragana else ""
-            }
-        ]
-    else:
-        # For nouns and other types, return base form only
-        conjugations = [
-            {
-                "form": "base",
-                "kanji": word_data.get('kanji', ''),
-                "hiragana": word_data.get('hiragana', '')
-            }
-        ]
-    
-    return conjugations
+    form_suffixes = FORM_SUFFIXES_BY_TYPE.get(word_data.get('type', 'noun'))
+    if form_suffixes is not None:
+        return _suffix_forms(word_data, form_suffixes)
+
+    # For nouns and other types, return base form only
+    return [
+        {
+            "form": "base",
+            "kanji": word_data.get('kanji', ''),
+            "hiragana": word_data.get('hiragana', '')
+        }
+    ]
+
+def _build_conjugation_response(word_id: str, word_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the conjugation payload for a single word."""
+    return {
+        "word_id": word_id,
+        "base_form": {
+            "kanji": word_data.get('kanji', ''),
+            "hiragana": word_data.get('hiragana', ''),
+            "english": word_data.get('english', ''),
+            "type": word_data.get('type', 'noun')
+        },
+        "conjugations": _generate_conjugations(word_data)
+    }
+
+def _build_conjugation_index(words: list) -> Dict[str, Dict[str, Any]]:
+    """Precompute conjugation payloads keyed by word ID, first word per ID wins."""
+    index = {}
+    for word in words:
+        word_id = generate_word_id(word)
+        if word_id not in index:
+            index[word_id] = _build_conjugation_response(word_id, word)
+    return index
+
+def _load_conjugations(word_ids) -> Dict[str, Dict[str, Any]]:
+    """Look up precomputed conjugation payloads for several IDs across all modules."""
+    indexes = [derive_module_data(module, 'conjugations', _build_conjugation_index) for module in MODULES]
+    found = {}
+    for word_id in word_ids:
+        for index in indexes:
+            payload = index.get(word_id)
+            if payload is not None:
+                found[word_id] = payload
+                break
+    return found
 
 @api.route('/conjugation/<string:word_id>')
 class ConjugationResource(Resource):
@@ -244,20 +246,42 @@ class ConjugationResource(Resource):
     @api.marshal_with(error_model, code=404)
     def get(self, word_id):
         """Return all conjugation forms for a word."""
-        word_data = _load_word_data(word_id)
+        payload = _load_conjugations((word_id,)).get(word_id)
         
-        if not word_data:
+        if payload is None:
             api.abort(404, "Word not found")
         
-        conjugations = _generate_conjugations(word_data)
+        return payload
+
+@api.route('/conjugation/batch')
+class ConjugationBatchResource(Resource):
+    @api.doc('get_conjugations_batch',
+             description=f'Get conjugation forms for up to {MAX_BATCH_SIZE} words in one request',
+             responses={
+                 200: 'Success - Returns conjugation forms for the words found',
+                 400: 'Invalid request'
+             })
+    @api.expect(batch_request_model)
+    @api.marshal_with(batch_response_model)
+    def post(self):
+        """Return conjugation forms for several words."""
+        data = request.get_json(silent=True)
+        word_ids = data.get('word_ids') if isinstance(data, dict) else None
+        
+        if not isinstance(word_ids, list) or not all(isinstance(word_id, str) for word_id in word_ids):
+            api.abort(400, "word_ids must be a list of strings")
+        if len(word_ids) > MAX_BATCH_SIZE:
+            api.abort(400, f"At most {MAX_BATCH_SIZE} word_ids per request")
+        
+        payloads = _load_conjugations(word_ids)
+        
+        results = []
+        not_found = []
+        for word_id in word_ids:
+            payload = payloads.get(word_id)
+            if payload is None:
+                not_found.append(word_id)
+            else:
+                results.append(payload)
         
-        return {
-            "word_id": word_id,
-            "base_form": {
-                "kanji": word_data.get('kanji', ''),
-                "hiragana": word_data.get('hiragana', ''),
-                "english": word_data.get('english', ''),
-                "type": word_data.get('type', 'noun')
-            },
-            "conjugations": conjugations
-        }
\ No newline at end of file
+        return {"results": results, "not_found": not_found}
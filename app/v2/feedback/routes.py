@@ -1,10 +1,14 @@
 from flask_restx import Api, Resource, fields
 from flask import Blueprint, request
-import json
+import logging
+import orjson
 import os
 from datetime import datetime
+import secrets
 import uuid
 
+logger = logging.getLogger(__name__)
+
 # Create API blueprint
 bp = Blueprint('v2_feedback_api', __name__)
 api = Api(bp, 
@@ -126,7 +130,7 @@ def _store_feedback_data(data: dict) -> bool:
         
         # Generate unique filename with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = secrets.token_hex(4)
         filename = f"feedback_{timestamp}_{unique_id}.json"
         filepath = os.path.join(feedback_dir, filename)
         
@@ -138,13 +142,13 @@ def _store_feedback_data(data: dict) -> bool:
         }
         
         # Write to file
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(feedback_record, f, indent=2, ensure_ascii=False)
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(feedback_record, option=orjson.OPT_INDENT_2))
         
         return True
         
     except Exception as e:
-        print(f"Error storing feedback data: {e}")
+        logger.error("Error storing feedback data: %s", e)
         return False
 
 @api.route('/feedback/answer')
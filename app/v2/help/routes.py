@@ -1,7 +1,7 @@
 from flask_restx import Api, Resource, fields
 from flask import Blueprint, request
-import json
-import os
+
+from ..common.data_loader import MODULES, derive_module_data
 
 # Create API blueprint
 bp = Blueprint('v2_help_api', __name__)
@@ -32,33 +32,27 @@ word_info_model = api.model('WordInfo', {
     'module': fields.String(description='Module where word was found')
 })
 
+def _build_word_lookup(words: list) -> dict:
+    """Map casefolded kanji, hiragana and english to the first matching word."""
+    lookup = {}
+    for word_data in words:
+        for key in ('kanji', 'hiragana', 'english'):
+            lookup.setdefault(word_data.get(key, '').casefold(), word_data)
+    return lookup
+
 def _search_word_in_modules(word: str) -> dict:
     """Search for word across all modules."""
-    modules = ['verbs', 'adjectives', 'hiragana', 'katakana', 'numbers_basic', 
-               'numbers_extended', 'days_of_week', 'months_complete', 
-               'colors_basic', 'greetings_essential', 'question_words', 
-               'base_nouns', 'katakana_words']
-    
-    for module in modules:
-        file_path = f"./datum/{module}.json"
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    words = json.load(f)
-                    for word_data in words:
-                        # Check if word matches kanji, hiragana, or english
-                        if (word_data.get('kanji', '').lower() == word.lower() or
-                            word_data.get('hiragana', '').lower() == word.lower() or
-                            word_data.get('english', '').lower() == word.lower()):
-                            return {
-                                'word': word,
-                                'found': True,
-                                'data': word_data,
-                                'module': module
-                            }
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading {module}.json: {e}")
-                continue
+    needle = word.casefold()
+    for module in MODULES:
+        # Check if word matches kanji, hiragana, or english
+        word_data = derive_module_data(module, 'help_lookup', _build_word_lookup).get(needle)
+        if word_data is not None:
+            return {
+                'word': word,
+                'found': True,
+                'data': word_data,
+                'module': module
+            }
     
     return {
         'word': word,
@@ -1,6 +1,6 @@
 from flask_restx import Api, Resource, fields
 from flask import Blueprint, request, session
-import json
+from types import MappingProxyType
 from typing import Dict, Any
 
 # Create API blueprint
@@ -61,42 +61,49 @@ error_model = api.model('Error', {
     'error': fields.String(description='Error message')
 })
 
+# Default settings matching V1 structure. Shared between requests: read-only,
+# nested values are replaced (never mutated) when settings are updated.
+_DEFAULT_SETTINGS = MappingProxyType({
+    "flashcard_type": "translation",
+    "display_mode": "kana",
+    "kana_type": "hiragana",
+    "input_modes": ["english"],
+    "furigana_enabled": False,
+    "furigana_size": "small",
+    "conjugation_forms": ["polite", "negative", "past", "past_negative"],
+    "practice_mode": "generation",
+    "priority_filter": "all",
+    "learning_order": True,
+    "proportions": {
+        "kana": 0.3,
+        "kanji": 0.2,
+        "kanji_furigana": 0.2,
+        "english": 0.3
+    },
+    "romaji_enabled": False,
+    "romaji_output_type": "hiragana",
+    "max_answer_attempts": 3
+})
+
+# (proportion name, request field, default weight) for weighted display mode
+_PROPORTION_FIELDS = tuple(
+    (name, f"proportion_{name}", weight)
+    for name, weight in _DEFAULT_SETTINGS["proportions"].items()
+)
+
 def _get_default_settings() -> Dict[str, Any]:
-    """Get default settings matching V1 structure."""
-    return {
-        "flashcard_type": "translation",
-        "display_mode": "kana",
-        "kana_type": "hiragana",
-        "input_modes": ["english"],
-        "furigana_enabled": False,
-        "furigana_size": "small",
-        "conjugation_forms": ["polite", "negative", "past", "past_negative"],
-        "practice_mode": "generation",
-        "priority_filter": "all",
-        "learning_order": True,
-        "proportions": {
-            "kana": 0.3,
-            "kanji": 0.2,
-            "kanji_furigana": 0.2,
-            "english": 0.3
-        },
-        "romaji_enabled": False,
-        "romaji_output_type": "hiragana",
-        "max_answer_attempts": 3
-    }
+    """Get a mutable copy of the default settings matching V1 structure."""
+    return dict(_DEFAULT_SETTINGS)
 
 def _process_settings_update(form_data: Dict[str, Any]) -> Dict[str, Any]:
     """Process settings update matching V1 logic."""
     processed = _get_default_settings()
     
-    # Update with provided data
+    # Update with provided data and collect enabled input modes in one pass
+    input_modes = []
     for key, value in form_data.items():
         if key in processed:
             processed[key] = value
-    
-    # Process input modes
-    input_modes = []
-    for key, value in form_data.items():
         if key.startswith("input_") and value:
             input_modes.append(key.replace("input_", ""))
     
@@ -106,10 +113,8 @@ def _process_settings_update(form_data: Dict[str, Any]) -> Dict[str, Any]:
     # Process proportions for weighted mode
     if processed.get("display_mode") == "weighted":
         proportions = {
-            "kana": float(form_data.get("proportion_kana", 0.3)),
-            "kanji": float(form_data.get("proportion_kanji", 0.2)),
-            "kanji_furigana": float(form_data.get("proportion_kanji_furigana", 0.2)),
-            "english": float(form_data.get("proportion_english", 0.3))
+            name: float(form_data.get(field, default))
+            for name, field, default in _PROPORTION_FIELDS
         }
         
         # Normalize proportions
@@ -149,12 +154,10 @@ class SettingsResource(Resource):
     def get(self, module_name):
         """Get current settings for a module."""
         session_key = f"flashcard_settings_{module_name}"
-        settings = session.get(session_key, {})
         
-        # If no settings found, return defaults
-        if not settings:
-            settings = _get_default_settings()
-            session[session_key] = settings
+        # If no settings found, return defaults without writing them back,
+        # so read-only requests don't re-sign and re-send the session cookie
+        settings = session.get(session_key) or _DEFAULT_SETTINGS
         
         return {"settings": settings}
     
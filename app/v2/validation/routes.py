@@ -1,8 +1,12 @@
-import os
 import json
+import logging
 from flask_restx import Api, Resource, fields
 from flask import Blueprint, request
 from typing import Dict, List, Any
+from ..common.data_loader import load_json_file
+from ..common.romaji_conversion import convert_to_hiragana
+
+logger = logging.getLogger(__name__)
 
 bp = Blueprint('v2_validation_api', __name__)
 api = Api(bp, 
@@ -30,15 +34,18 @@ validation_response_model = api.model('ValidationResponse', {
     'correct_strokes': fields.List(fields.List(fields.Integer), description='Correct stroke coordinates'),
 })
 
+# Upper bound on input length; answers are a few kana, and converted
+# inputs are memoized, so oversized bodies must not reach the cache
+MAX_INPUT_LENGTH = 64
+
 # Load stroke data
 def load_stroke_data() -> Dict[str, Any]:
     file_path = "./datum/stroke_data.json"
     
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json_file(file_path)
     except (json.JSONDecodeError, IOError) as e:
-        print(f"Error loading stroke_data.json: {e}")
+        logger.warning("Error loading stroke_data.json: %s", e)
         return {}
 
 def validate_strokes(character: str, stroke_data: Dict[str, Any], reference_data: Dict[str, Any]) -> List[str]:
@@ -141,9 +148,12 @@ class InputValidation(Resource):
         
         if not character or not user_input:
             api.abort(400, "Missing character or input")
+        if not isinstance(character, str) or not isinstance(user_input, str):
+            api.abort(400, "character and input must be strings")
+        if len(user_input) > MAX_INPUT_LENGTH:
+            api.abort(400, f"input must be at most {MAX_INPUT_LENGTH} characters")
         
         # Convert romaji to hiragana if needed
-        from ..common.romaji_conversion import convert_to_hiragana
         normalized_input = convert_to_hiragana(user_input)
         
         return {
@@ -1,11 +1,9 @@
 from flask_restx import Api, Resource, fields
 from flask import Blueprint
-import json
-import os
-import hashlib
-import uuid
 import random
-from collections import defaultdict
+import threading
+
+from ..common.data_loader import derive_module_data, generate_word_id
 
 # Create API blueprint
 bp = Blueprint('v2_words_api', __name__)
@@ -66,41 +64,29 @@ words_response_model = api.model('WordsResponse', {
     'words': fields.List(fields.Nested(word_model), description='List of words')
 })
 
-def _load_module_data(module_name: str) -> list:
-    """Load word data from JSON file."""
-    # Use relative path from project root
-    file_path = f"./datum/{module_name}.json"
-    
-    if not os.path.exists(file_path):
-        return []
-    
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
-        print(f"Error loading {module_name}.json: {e}")
-        return []
-
-def _generate_deterministic_id(word: dict) -> str:
-    """Generate a deterministic ID for a word."""
-    word_content = f"{word.get('kanji', '')}{word.get('hiragana', '')}{word.get('english', '')}"
-    word_hash = hashlib.md5(word_content.encode()).hexdigest()
-    return str(uuid.uuid5(uuid.NAMESPACE_DNS, word_hash))
-
 # Global queue management for random word selection
-_word_queues = defaultdict(list)
+# module -> (word list the queue was shuffled for, remaining word indices)
+_word_queues = {}
+_word_queues_lock = threading.Lock()
 
-def _get_random_word_from_queue(words: list, module: str) -> dict:
+# Dedicated generator so word picks don't share the module-level random state
+_rng = random.Random()
+
+def _get_random_word_from_queue(words: tuple, module: str) -> dict:
     """Get a random word using queue-based selection to avoid repeats."""
-    global _word_queues
-    
-    # Initialize or refill queue if empty
-    if not _word_queues[module]:
-        _word_queues[module] = [i for i in range(len(words))]
-        random.shuffle(_word_queues[module])
+    with _word_queues_lock:
+        queue = _word_queues.get(module)
+        
+        # Initialize or refill queue if empty or drawn from an older dataset
+        if queue is None or queue[0] is not words or not queue[1]:
+            indices = list(range(len(words)))
+            _rng.shuffle(indices)
+            queue = (words, indices)
+            _word_queues[module] = queue
+        
+        # Get next word index from queue
+        word_index = queue[1].pop()
     
-    # Get next word index from queue
-    word_index = _word_queues[module].pop()
     return words[word_index]
 
 def _parse_multiple_meanings(english_text: str) -> list:
@@ -118,6 +104,34 @@ def _parse_multiple_meanings(english_text: str) -> list:
     
     return meanings if meanings else [english_text]
 
+def _format_word(word: dict) -> dict:
+    """Transform a raw dataset word into the V2 word format."""
+    # Handle different furigana data structures
+    furigana = ""
+    if "kanji_analysis" in word and "furigana_text" in word["kanji_analysis"]:
+        furigana = word["kanji_analysis"]["furigana_text"]
+    elif "furigana_text" in word:
+        furigana = word["furigana_text"]
+    
+    return {
+        "id": generate_word_id(word),
+        "kanji": word.get("kanji", ""),
+        "hiragana": word.get("hiragana", ""),
+        "katakana": word.get("katakana", ""),
+        "english": _parse_multiple_meanings(word.get("english", "")),
+        "type": word.get("type", "noun"),
+        "furigana": furigana,
+        "romaji": word.get("romaji", "")
+    }
+
+def _format_words(words: list) -> tuple:
+    """Transform a module's words to V2 format (cached per dataset, read-only).
+
+    Returned as a tuple: it is shared across requests, so it should not be
+    appendable, and it is sized exactly instead of over-allocated.
+    """
+    return tuple(_format_word(word) for word in words)
+
 @api.route('/words/<string:module>')
 class WordsResource(Resource):
     @api.doc('get_words', 
@@ -162,28 +176,8 @@ class WordsResource(Resource):
     @api.marshal_with(words_response_model)
     def get(self, module):
         """Return list of words for a module."""
-        words = _load_module_data(module)
-        
-        # Transform data to V2 format
-        formatted_words = []
-        for word in words:
-            # Handle different furigana data structures
-            furigana = ""
-            if "kanji_analysis" in word and "furigana_text" in word["kanji_analysis"]:
-                furigana = word["kanji_analysis"]["furigana_text"]
-            elif "furigana_text" in word:
-                furigana = word["furigana_text"]
-            
-            formatted_words.append({
-                "id": _generate_deterministic_id(word),
-                "kanji": word.get("kanji", ""),
-                "hiragana": word.get("hiragana", ""),
-                "katakana": word.get("katakana", ""),
-                "english": _parse_multiple_meanings(word.get("english", "")),
-                "type": word.get("type", "noun"),
-                "furigana": furigana,
-                "romaji": word.get("romaji", "")
-            })
+        # Formatted words (with IDs) are built once per dataset load
+        formatted_words = derive_module_data(module, 'formatted', _format_words)
         
         return {"words": formatted_words}
 
@@ -211,30 +205,12 @@ class RandomWordResource(Resource):
              })
     def get(self, module):
         """Return a single random word from a module."""
-        words = _load_module_data(module)
+        words = derive_module_data(module, 'formatted', _format_words)
         
         if not words:
             api.abort(404, f"Module '{module}' not found")
         
         # Select random word using queue to avoid repeats
-        random_word = _get_random_word_from_queue(words, module)
-        
-        # Handle different furigana data structures
-        furigana = ""
-        if "kanji_analysis" in random_word and "furigana_text" in random_word["kanji_analysis"]:
-            furigana = random_word["kanji_analysis"]["furigana_text"]
-        elif "furigana_text" in random_word:
-            furigana = random_word["furigana_text"]
-        
-        formatted_word = {
-            "id": _generate_deterministic_id(random_word),
-            "kanji": random_word.get("kanji", ""),
-            "hiragana": random_word.get("hiragana", ""),
-            "katakana": random_word.get("katakana", ""),
-            "english": _parse_multiple_meanings(random_word.get("english", "")),
-            "type": random_word.get("type", "noun"),
-            "furigana": furigana,
-            "romaji": random_word.get("romaji", "")
-        }
+        formatted_word = _get_random_word_from_queue(words, module)
         
         return formatted_word
\ No newline at end of file